@@ -0,0 +1,36 @@
+# cython: language_level=3
+"""
+Cython build of the P/E filter kernel used by healthcare sector filter.py
+
+Build it in place with:  cythonize -i filter_pe.pyx
+"""
+import numpy as np
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def filter_pe(const double[::1] p, const double[::1] e, double lo, double hi):
+    """
+    P/E kernel over contiguous float64 price / TTM EPS arrays
+    Returns (uint8 mask of lo < P/E < hi, raw P/E)
+    
+    NaN prices / EPS give a NaN P/E and zero EPS gives inf or NaN, so missing
+    data fails the range test without a branch of its own
+    """
+    cdef Py_ssize_t i, n = p.shape[0]
+    cdef double r
+    mask_array = np.empty(n, dtype=np.uint8)
+    pe_array = np.empty(n, dtype=np.float64)
+    cdef unsigned char[::1] mask = mask_array
+    cdef double[::1] pe = pe_array
+    
+    with nogil:
+        for i in range(n):
+            r = p[i] / e[i]
+            pe[i] = r
+            mask[i] = (r > lo) & (r < hi)
+    
+    return mask_array, pe_array
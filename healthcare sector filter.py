@@ -1,193 +1,281 @@
-import csv
+import os
+import sys
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+from numba import njit, prange, types
+
+try:
+    # Cython build of the P/E kernel, only there once filter_pe.pyx is compiled
+    from filter_pe import filter_pe
+except ImportError:
+    filter_pe = None
+
+# Explicit kernel signatures so Numba compiles (or loads from its on-disk cache) at
+# import time. Inputs are read-only because pandas hands out read-only column views;
+# writable arrays convert to these types too
+_float_column = types.Array(types.float64, 1, 'C', readonly=True)
+_offsets_array = types.Array(types.int64, 1, 'C', readonly=True)
+_score_result = types.Tuple((types.boolean[::1], types.float64[::1]))
 
 def load_csv_data(filename):
     """
-    Load CSV data and organize it into a list of dictionaries
+    Load the columns we need from the CSV into a pandas DataFrame
+    Parsing is done by Arrow's multithreaded CSV reader, and the parsed columns
+    are cached next to the CSV as <filename>.parquet for later runs
+    Missing prices / EPS come through as NaN; ticker and quarter are stored as
+    categoricals so filtering and grouping compare small integer codes
     """
-    data = []
-    skipped_rows = 0
+    # Reuse the parsed columns from the Parquet sidecar unless the CSV is newer
+    cache_file = filename + ".parquet"
+    if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(filename):
+        data = pd.read_parquet(cache_file, engine='pyarrow')
+        source = cache_file
+    else:
+        dictionary_string = pa.dictionary(pa.int32(), pa.string())
+        table = pv.read_csv(
+            filename,
+            convert_options=pv.ConvertOptions(
+                include_columns=['tic', 'datafqtr', 'prccq', 'epsf12'],
+                column_types={'tic': dictionary_string, 'datafqtr': dictionary_string,
+                              'prccq': pa.float64(), 'epsf12': pa.float64()},
+                strings_can_be_null=True,
+            ),
+        )
+        data = table.to_pandas()
+        source = filename
+        try:
+            data.to_parquet(cache_file, engine='pyarrow')
+        except OSError as e:
+            print(f"Couldn't write cache {cache_file}: {e}")
     
-    with open(filename, "r") as csvfile:
-        reader = csv.DictReader(csvfile)  # This automatically uses the first row as headers
-        
-        # Print the column headers to make sure they match
-        # print(f"Column headers found: {reader.fieldnames}")
-        
-        for row_num, row in enumerate(reader):
-            # Convert numeric fields from strings to numbers
-            try:
-                # Handle empty strings and convert to float
-                row['prccq'] = float(row['prccq']) if row['prccq'] and row['prccq'].strip() != '' else None
-                row['epsf12'] = float(row['epsf12']) if row['epsf12'] and row['epsf12'].strip() != '' else None
-            except (ValueError, KeyError) as e:
-                skipped_rows += 1
-                if skipped_rows <= 5:  # Show first 5 errors
-                    print(f"Skipping row {row_num + 2}: {e}")
-                continue
-                
-            data.append(row)
-    
-    print(f"Loaded {len(data)} records from {filename}")
-    if skipped_rows > 0:
-        print(f"Skipped {skipped_rows} rows due to data issues")
+    # Previous year's same quarter for every row, worked out once per distinct quarter
+    # Both columns share one set of categories so they can be joined on directly
+    quarters = data['datafqtr'].cat.categories
+    previous_quarters = pd.Index([get_previous_year_quarter(q) for q in quarters])
+    all_quarters = quarters.union(previous_quarters)
+    data['prev_q'] = data['datafqtr'].cat.rename_categories(previous_quarters).cat.set_categories(all_quarters)
+    data['datafqtr'] = data['datafqtr'].cat.set_categories(all_quarters)
+    
+    print(f"Loaded {len(data)} records from {source}")
     
     # Show a sample of the data
     print(f"\nSample of first 3 records:")
-    for i, row in enumerate(data[:3]):
-        print(f"Row {i+1}: ticker={row.get('tic')}, quarter={row.get('datafqtr')}, price={row.get('prccq')}, eps_ttm={row.get('epsf12')}")
+    for i, row in enumerate(data.head(3).itertuples(index=False)):
+        print(f"Row {i+1}: ticker={row.tic}, quarter={row.datafqtr}, price={row.prccq}, eps_ttm={row.epsf12}")
     
     return data
 
-def find_stocks_with_good_pe(data, target_quarter):
+def group_by_quarter(data):
+    """
+    Split the data into one DataFrame per fiscal quarter in a single pass
+    Quarters that aren't in the data map to an empty DataFrame
+    """
+    empty = data.iloc[:0]
+    by_quarter = defaultdict(lambda: empty)
+    for quarter, quarter_data in data.groupby('datafqtr', sort=False, observed=True):
+        by_quarter[sys.intern(quarter)] = quarter_data
+    return by_quarter
+
+@njit(_score_result(_float_column, _float_column), cache=True, error_model='numpy')
+def _score(prices, eps):
+    """
+    Compiled P/E kernel over contiguous float64 price / TTM EPS arrays
+    Returns (mask of 0 < P/E < 20, raw P/E)
+    
+    There's no branch for missing data or zero EPS: NaN prices / EPS give a NaN P/E
+    and zero EPS gives inf or NaN, all of which fail the 0 < P/E < 20 test
+    """
+    n = prices.shape[0]
+    mask = np.empty(n, np.bool_)
+    pe = np.empty(n, np.float64)
+    for i in range(n):
+        r = prices[i] / eps[i]
+        pe[i] = r
+        mask[i] = (r > 0) & (r < 20)
+    return mask, pe
+
+@njit(_score_result(_float_column, _float_column, _offsets_array), cache=True, error_model='numpy', parallel=True)
+def _score_quarters(prices, eps, offsets):
+    """
+    _score for several quarters at once, with the quarters spread across threads
+    Rows for quarter qi are prices[offsets[qi]:offsets[qi + 1]] (same for eps)
+    """
+    n = prices.shape[0]
+    mask = np.empty(n, np.bool_)
+    pe = np.empty(n, np.float64)
+    for qi in prange(offsets.shape[0] - 1):
+        for i in range(offsets[qi], offsets[qi + 1]):
+            r = prices[i] / eps[i]
+            pe[i] = r
+            mask[i] = (r > 0) & (r < 20)
+    return mask, pe
+
+def _good_pe_frame(tickers, prices, eps, good, pe):
+    """
+    DataFrame of the rows flagged in good, sorted by P/E ratio (lowest first)
+    """
+    good_idx = np.flatnonzero(good)
+    good_idx = good_idx[np.argsort(pe[good_idx], kind='stable')]
+    return pd.DataFrame({
+        'ticker': tickers[good_idx],
+        'pe_ratio': pe[good_idx],
+        'price': prices[good_idx],
+        'eps_ttm': eps[good_idx],
+    })
+
+def find_stocks_with_good_pe(quarter_data, target_quarter, debug=False):
     """
     Find stocks in a specific quarter with P/E ratio between 0 and 20
     Using epsf12 (EPS TTM excluding extraordinary items)
+    quarter_data is that quarter's slice from group_by_quarter()
+    debug=True also prints a data sample and the P/E ratio distribution
     
-    Returns list of dictionaries with ticker, P/E ratio, price, and EPS
+    Returns a DataFrame with one column each for ticker, P/E ratio, price, and EPS
     """
-    # Counters for debugging
-    total_in_quarter = 0
-    missing_price = 0
-    missing_eps = 0
-    zero_eps = 0
-    negative_pe = 0
-    high_pe = 0
-    good_stocks = []
-    
     print(f"\nAnalyzing data for {target_quarter} using epsf12 (TTM EPS)...")
     print("-" * 60)
     
-    # Let's also track some sample P/E ratios to see what we're getting
-    all_pe_ratios = []
-    sample_data = []
-    
-    for row in data:
-        # Check if this row is for our target quarter
-        if row['datafqtr'] == target_quarter:
-            total_in_quarter += 1
-            
-            # Store first 10 records for inspection
-            if len(sample_data) < 10:
-                sample_data.append({
-                    'ticker': row['tic'],
-                    'price': row['prccq'],
-                    'eps_ttm': row['epsf12']
-                })
-            
-            # Check for missing price data
-            if row['prccq'] is None or row['prccq'] == '':
-                missing_price += 1
-                continue
-                
-            # Check for missing EPS data
-            if row['epsf12'] is None or row['epsf12'] == '':
-                missing_eps += 1
-                continue
-                
-            # Check for zero EPS (can't calculate P/E)
-            if row['epsf12'] == 0:
-                zero_eps += 1
-                continue
-                
-            # Calculate P/E ratio using TTM EPS
-            pe_ratio = row['prccq'] / row['epsf12']
-            all_pe_ratios.append(pe_ratio)
-            
-            # Check if P/E is negative (negative earnings)
-            if pe_ratio <= 0:
-                negative_pe += 1
-                continue
-                
-            # Check if P/E is too high
-            if pe_ratio >= 20:
-                high_pe += 1
-                continue
-                
-            # If we get here, it's a good stock!
-            good_stocks.append({
-                'ticker': row['tic'],
-                'pe_ratio': pe_ratio,
-                'price': row['prccq'],
-                'eps_ttm': row['epsf12']
-            })
-    
-    # Sort by P/E ratio (lowest first)
-    good_stocks.sort(key=lambda x: x['pe_ratio'])
+    tickers = quarter_data['tic'].to_numpy()
+    prices = np.ascontiguousarray(quarter_data['prccq'].to_numpy(dtype=np.float64))
+    eps = np.ascontiguousarray(quarter_data['epsf12'].to_numpy(dtype=np.float64))
+    
+    # Calculate P/E ratio using TTM EPS for the whole quarter at once
+    if filter_pe is not None:
+        good, pe = filter_pe(prices, eps, 0.0, 20.0)
+        good = good.view(np.bool_)
+    else:
+        good, pe = _score(prices, eps)
+    
+    # Masks for debugging counters
+    no_price = np.isnan(prices)
+    no_eps = ~no_price & np.isnan(eps)
+    has_pe = np.isfinite(pe) & (eps != 0)
+    zero_eps = ~no_price & ~no_eps & (eps == 0)
+    negative_pe = has_pe & (pe <= 0)
+    high_pe = has_pe & (pe >= 20)
+    
+    good_stocks = _good_pe_frame(tickers, prices, eps, good, pe)
     
     # Print detailed breakdown
-    print(f"Total stocks in {target_quarter}: {total_in_quarter}")
-    print(f"Missing price data: {missing_price}")
-    print(f"Missing TTM EPS data: {missing_eps}")
-    print(f"Zero TTM EPS (can't calculate P/E): {zero_eps}")
-    print(f"Negative P/E (negative earnings): {negative_pe}")
-    print(f"P/E >= 20 (too high): {high_pe}")
+    print(f"Total stocks in {target_quarter}: {len(quarter_data)}")
+    print(f"Missing price data: {np.count_nonzero(no_price)}")
+    print(f"Missing TTM EPS data: {np.count_nonzero(no_eps)}")
+    print(f"Zero TTM EPS (can't calculate P/E): {np.count_nonzero(zero_eps)}")
+    print(f"Negative P/E (negative earnings): {np.count_nonzero(negative_pe)}")
+    print(f"P/E >= 20 (too high): {np.count_nonzero(high_pe)}")
     print(f"Valid stocks with 0 < P/E < 20: {len(good_stocks)}")
     
-    # Show sample data for debugging
-    print(f"\nSample of data in {target_quarter} (using TTM EPS):")
-    for i, sample in enumerate(sample_data[:5]):
-        pe = "N/A"
-        if sample['price'] is not None and sample['eps_ttm'] is not None and sample['eps_ttm'] != 0:
-            pe = f"{sample['price'] / sample['eps_ttm']:.2f}"
-        print(f"  {sample['ticker']}: Price={sample['price']}, TTM_EPS={sample['eps_ttm']}, P/E={pe}")
-    
-    # Show P/E ratio distribution
-    if all_pe_ratios:
-        all_pe_ratios.sort()
-        positive_ratios = [pe for pe in all_pe_ratios if pe > 0]
-        if positive_ratios:
+    # Sample data and P/E distribution are only worked out when debugging
+    if debug:
+        # Show sample data
+        print(f"\nSample of data in {target_quarter} (using TTM EPS):")
+        for i in range(min(5, len(quarter_data))):
+            sample_pe = f"{pe[i]:.2f}" if has_pe[i] else "N/A"
+            print(f"  {tickers[i]}: Price={prices[i]}, TTM_EPS={eps[i]}, P/E={sample_pe}")
+    
+        # Show P/E ratio distribution
+        # Sort once, then each bucket edge is a binary search
+        positive_ratios = np.sort(pe[has_pe & (pe > 0)])
+        if positive_ratios.size:
+            under_10, under_20, under_30, under_50 = np.searchsorted(positive_ratios, [10, 20, 30, 50])
             print(f"\nP/E ratio distribution (positive ratios only):")
-            print(f"  Lowest P/E: {min(positive_ratios):.2f}")
-            print(f"  Highest P/E: {max(positive_ratios):.2f}")
-            print(f"  Number with P/E < 10: {len([pe for pe in positive_ratios if pe < 10])}")
-            print(f"  Number with P/E 10-20: {len([pe for pe in positive_ratios if 10 <= pe < 20])}")
-            print(f"  Number with P/E 20-30: {len([pe for pe in positive_ratios if 20 <= pe < 30])}")
-            print(f"  Number with P/E 30-50: {len([pe for pe in positive_ratios if 30 <= pe < 50])}")
-            print(f"  Number with P/E > 50: {len([pe for pe in positive_ratios if pe >= 50])}")
+            print(f"  Lowest P/E: {positive_ratios[0]:.2f}")
+            print(f"  Highest P/E: {positive_ratios[-1]:.2f}")
+            print(f"  Number with P/E < 10: {under_10}")
+            print(f"  Number with P/E 10-20: {under_20 - under_10}")
+            print(f"  Number with P/E 20-30: {under_30 - under_20}")
+            print(f"  Number with P/E 30-50: {under_50 - under_30}")
+            print(f"  Number with P/E > 50: {positive_ratios.size - under_50}")
     
     return good_stocks
 
-def calculate_peg_for_stock(data, ticker, current_quarter):
+def screen_quarters(by_quarter, quarters):
+    """
+    Run the P/E screen for many quarters in one parallel pass, without the printout
+    by_quarter comes from group_by_quarter()
+    
+    Returns {quarter: DataFrame}, each the same as find_stocks_with_good_pe() gives
+    """
+    quarters = [sys.intern(q) for q in quarters]
+    frames = [by_quarter[q] for q in quarters]
+    if not frames:
+        return {}
+    
+    # Lay the quarters end to end so the kernel can hand one quarter to each thread
+    offsets = np.zeros(len(frames) + 1, dtype=np.int64)
+    np.cumsum([len(frame) for frame in frames], out=offsets[1:])
+    prices = np.concatenate([frame['prccq'].to_numpy(dtype=np.float64) for frame in frames])
+    eps = np.concatenate([frame['epsf12'].to_numpy(dtype=np.float64) for frame in frames])
+    good, pe = _score_quarters(prices, eps, offsets)
+    
+    results = {}
+    for quarter, frame, start, end in zip(quarters, frames, offsets[:-1], offsets[1:]):
+        results[quarter] = _good_pe_frame(
+            frame['tic'].to_numpy(), prices[start:end], eps[start:end], good[start:end], pe[start:end]
+        )
+    return results
+
+def get_previous_year_quarter(quarter):
+    """
+    Same quarter one year earlier, e.g. 2016Q1 -> 2015Q1
+    """
+    year = int(quarter[:4])
+    quarter_part = quarter[4:]  # Q1, Q2, etc.
+    return sys.intern(f"{year-1}{quarter_part}")
+
+def build_ticker_quarter_index(data):
+    """
+    Build a (ticker, quarter) -> row lookup so PEG calculations don't rescan the data
+    Keeps the first record when a ticker shows up more than once in a quarter
+    Ticker and quarter strings are interned so key matches are pointer compares
+    """
+    index = {}
+    keyed_rows = data.dropna(subset=['tic', 'datafqtr']).drop_duplicates(['tic', 'datafqtr'])
+    for row in keyed_rows.to_dict('records'):
+        row['tic'] = sys.intern(row['tic'])
+        row['datafqtr'] = sys.intern(row['datafqtr'])
+        row['prev_q'] = sys.intern(row['prev_q'])
+        index[(row['tic'], row['datafqtr'])] = row
+    return index
+
+def calculate_peg_for_stock(index, ticker, current_quarter):
     """
     Calculate PEG ratio for a specific stock using TTM EPS data
+    index comes from build_ticker_quarter_index()
     """
+    ticker = sys.intern(ticker)
+    current_quarter = sys.intern(current_quarter)
+    
     # Find current quarter data for this ticker
-    current_data = None
-    for row in data:
-        if row['tic'] == ticker and row['datafqtr'] == current_quarter:
-            current_data = row
-            break
+    current_data = index.get((ticker, current_quarter))
     
-    if not current_data:
+    if current_data is None:
         return f"No data found for {ticker} in {current_quarter}"
     
     # Calculate current P/E using TTM EPS
-    if current_data['epsf12'] == 0 or current_data['epsf12'] is None:
+    if pd.isna(current_data['epsf12']) or current_data['epsf12'] == 0:
         return f"Cannot calculate P/E for {ticker} - TTM EPS is zero or missing"
     
     current_pe = current_data['prccq'] / current_data['epsf12']
     
-    # Figure out the previous year's same quarter
-    # e.g., if current is 2016Q1, we want 2015Q1
-    year = int(current_quarter[:4])
-    quarter_part = current_quarter[4:]  # Q1, Q2, etc.
-    previous_quarter = f"{year-1}{quarter_part}"
+    # Previous year's same quarter was worked out at load time
+    previous_quarter = current_data['prev_q']
     
     # Find previous year data
-    previous_data = None
-    for row in data:
-        if row['tic'] == ticker and row['datafqtr'] == previous_quarter:
-            previous_data = row
-            break
+    previous_data = index.get((ticker, previous_quarter))
     
-    if not previous_data:
+    if previous_data is None:
         return f"No data found for {ticker} in {previous_quarter}"
     
     # Calculate EPS growth using TTM EPS
     current_eps = current_data['epsf12']
     previous_eps = previous_data['epsf12']
     
-    if previous_eps <= 0 or previous_eps is None:
+    if pd.isna(previous_eps) or previous_eps <= 0:
         return f"Cannot calculate growth for {ticker} - previous TTM EPS is {previous_eps}"
     
     # EPS growth rate as percentage
@@ -210,55 +298,78 @@ def calculate_peg_for_stock(data, ticker, current_quarter):
         'peg_ratio': peg_ratio
     }
 
-def analyze_quarter(data, quarter):
+def calculate_peg_for_quarter(by_quarter, current_quarter):
+    """
+    Calculate P/E, TTM EPS growth and PEG for every stock in a quarter with one join
+    against the previous year's same quarter
+    
+    Returns a DataFrame indexed by ticker; has_previous is False where the ticker
+    has no row in the previous year's quarter
+    """
+    current = by_quarter[current_quarter].drop_duplicates('tic')[['tic', 'prev_q', 'prccq', 'epsf12']]
+    previous = by_quarter[get_previous_year_quarter(current_quarter)].drop_duplicates('tic')[['tic', 'datafqtr', 'epsf12']]
+    previous = previous.rename(columns={'datafqtr': 'prev_q', 'epsf12': 'epsf12_prev'}).assign(has_previous=True)
+    
+    merged = current.merge(previous, on=['tic', 'prev_q'], how='left').set_index('tic')
+    merged['has_previous'] = merged['has_previous'].fillna(False).astype(bool)
+    
+    # EPS growth rate as percentage, then PEG
+    merged['pe_ratio'] = merged['prccq'] / merged['epsf12']
+    merged['eps_growth_percent'] = (merged['epsf12'] - merged['epsf12_prev']) / merged['epsf12_prev'] * 100
+    merged['peg_ratio'] = merged['pe_ratio'] / merged['eps_growth_percent']
+    return merged
+
+def analyze_quarter(by_quarter, quarter, debug=False):
     """
     Complete analysis: find good P/E stocks and calculate PEG ratios
+    by_quarter comes from group_by_quarter(); debug is passed on to find_stocks_with_good_pe()
     """
+    quarter = sys.intern(quarter)
+    
     print(f"\n" + "="*50)
     print(f"ANALYZING QUARTER: {quarter}")
     print(f"="*50)
     
     # Step 1: Find stocks with good P/E ratios
-    good_pe_stocks = find_stocks_with_good_pe(data, quarter)
+    good_pe_stocks = find_stocks_with_good_pe(by_quarter[quarter], quarter, debug=debug)
     
-    if not good_pe_stocks:
+    if good_pe_stocks.empty:
         print("No stocks found meeting P/E criteria")
-        return [], []  # Return empty lists instead of None
+        return good_pe_stocks, []  # Return empty results instead of None
     
     # Show ALL stocks by P/E
     print(f"\nAll stocks with P/E < 20:")
     print(f"{'Ticker':<8} {'P/E Ratio':<10} {'Price':<10} {'TTM_EPS':<10}")
     print("-" * 42)
     
-    for stock in good_pe_stocks:
-        print(f"{stock['ticker']:<8} {stock['pe_ratio']:<10.2f} {stock['price']:<10.2f} {stock['eps_ttm']:<10.2f}")
+    # Build the whole table first and write it in one go
+    lines = [
+        f"{ticker:<8} {pe_ratio:<10.2f} {price:<10.2f} {eps_ttm:<10.2f}"
+        for ticker, pe_ratio, price, eps_ttm in zip(
+            good_pe_stocks['ticker'], good_pe_stocks['pe_ratio'], good_pe_stocks['price'], good_pe_stocks['eps_ttm']
+        )
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Step 2: Calculate PEG ratios for all stocks that match criteria
     print(f"\nCalculating PEG ratios for stocks...")
     print("-" * 60)
-    good_peg_tickers = []
-
-    for stock in good_pe_stocks:
-        ticker = stock['ticker']
-        # print(f"\nAnalyzing {ticker}:")
-        
-        peg_result = calculate_peg_for_stock(data, ticker, quarter)
-        
-        if isinstance(peg_result, str):  # Error message
-            print(f"  Error: {peg_result}")
+    peg_data = calculate_peg_for_quarter(by_quarter, quarter)
+    pe_ratio = peg_data['pe_ratio']
+    candidates = peg_data[(pe_ratio > 0) & (pe_ratio < 20)].sort_values('pe_ratio', kind='stable')
+    
+    previous_quarter = get_previous_year_quarter(quarter)
+    problems = candidates[~(candidates['epsf12_prev'] > 0)]
+    for ticker, has_previous, previous_eps in zip(problems.index, problems['has_previous'], problems['epsf12_prev']):
+        if not has_previous:
+            print(f"  Error: No data found for {ticker} in {previous_quarter}")
         else:
-            # print(f"  P/E Ratio: {peg_result['pe_ratio']:.2f}")
-            # print(f"  EPS Growth: {peg_result['eps_growth_percent']:.1f}%")
-            # print(f"  PEG Ratio: {peg_result['peg_ratio']}")
-            
-            GOOD_PEG = 1
-            if not isinstance(peg_result['peg_ratio'], str) and peg_result['peg_ratio'] < GOOD_PEG:
-                #print(f"  {ticker} has a good PEG ratio: {peg_result['peg_ratio']:.2f}")
-                good_peg_tickers.append(ticker)
-    print(f"\nStocks with good PEG ratios (PEG < 1):", end=' ')
-    for ticker in good_peg_tickers:
-        print(f"{ticker}, ", end='')
-    print()  # Newline for better formatting
+            print(f"  Error: Cannot calculate growth for {ticker} - previous TTM EPS is {previous_eps}")
+    
+    GOOD_PEG = 1
+    good_peg = (candidates['epsf12_prev'] > 0) & (candidates['eps_growth_percent'] > 0) & (candidates['peg_ratio'] < GOOD_PEG)
+    good_peg_tickers = candidates.index[good_peg].tolist()
+    print(f"\nStocks with good PEG ratios (PEG < 1): {', '.join(good_peg_tickers)}")
     return good_pe_stocks, good_peg_tickers
 
 
@@ -270,14 +381,16 @@ if __name__ == "__main__":
     
     try:
         data = load_csv_data("healthcare.csv")
+        by_quarter = group_by_quarter(data)
         
         # Analyze a specific quarter
         target_quarter = "2016Q1"  # Change this to whatever quarter you want
-        pe_stocks, peg_stocks = analyze_quarter(data, target_quarter)
+        pe_stocks, peg_stocks = analyze_quarter(by_quarter, target_quarter)
         
         # You can also run individual functions:
-        # good_stocks = find_stocks_with_good_pe(data, "2016Q1")
-        # peg_data = calculate_peg_for_stock(data, "JNJ", "2016Q1")
+        # good_stocks = find_stocks_with_good_pe(by_quarter["2016Q1"], "2016Q1")
+        # good_stocks_by_quarter = screen_quarters(by_quarter, sorted(by_quarter))
+        # peg_data = calculate_peg_for_stock(build_ticker_quarter_index(data), "JNJ", "2016Q1")
         
     
     except Exception as e: